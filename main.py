@@ -11,6 +11,9 @@ from midi_downloader.application.use_cases.download_game_use_case import Downloa
 from midi_downloader.application.use_cases.download_system_use_case import DownloadSystemUseCase
 
 
+LISTING_CACHE_NAME = '.khinsider_listings.json'
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -43,12 +46,39 @@ def main():
         help='Delay between requests in seconds'
     )
     
+    parser.add_argument(
+        '--burst',
+        type=int,
+        default=1,
+        help='Requests allowed back-to-back before the delay applies'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DownloadGameUseCase.DEFAULT_MAX_WORKERS,
+        help='Number of concurrent downloads'
+    )
+    
+    parser.add_argument(
+        '--game-workers',
+        type=int,
+        default=DownloadSystemUseCase.DEFAULT_MAX_WORKERS,
+        help='Number of games processed concurrently for --system'
+    )
+    
     parser.add_argument(
         '--resume',
         action='store_true',
         help='Skip already downloaded files'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not cache scraped HTML pages or system listings on disk'
+    )
+    
     parser.add_argument(
         '--user-agent',
         type=str,
@@ -66,23 +96,35 @@ def main():
     # Initialize dependencies (Dependency Injection)
     client = KhinsiderClient(
         rate_limit_delay=args.delay,
-        user_agent=args.user_agent
+        user_agent=args.user_agent,
+        burst=args.burst,
+        cache_name=None if args.no_cache else KhinsiderClient.DEFAULT_CACHE_NAME
     )
     scraper = KhinsiderScraper()
     file_repo = FileSystemRepository()
-    khinsider_repo = KhinsiderRepositoryImpl(client, scraper)
+    khinsider_repo = KhinsiderRepositoryImpl(
+        client,
+        scraper,
+        listing_cache_path=None if args.no_cache else output_dir / LISTING_CACHE_NAME
+    )
     
     try:
         if args.game:
             # Download specific game
-            download_game_uc = DownloadGameUseCase(khinsider_repo, file_repo, client)
+            download_game_uc = DownloadGameUseCase(
+                khinsider_repo, file_repo, client, max_workers=args.workers
+            )
             downloaded = download_game_uc.execute(args.game, output_dir, args.resume)
             print(f"\nDownloaded {len(downloaded)} MIDI files")
         
         elif args.system:
             # Download entire system
-            download_game_uc = DownloadGameUseCase(khinsider_repo, file_repo, client)
-            download_system_uc = DownloadSystemUseCase(khinsider_repo, download_game_uc)
+            download_game_uc = DownloadGameUseCase(
+                khinsider_repo, file_repo, client, max_workers=args.workers
+            )
+            download_system_uc = DownloadSystemUseCase(
+                khinsider_repo, download_game_uc, max_workers=args.game_workers
+            )
             games = download_system_uc.execute(args.system, output_dir, args.resume)
             
             total_midis = sum(len(game.midi_files) for game in games)
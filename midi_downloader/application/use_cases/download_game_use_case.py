@@ -1,7 +1,9 @@
 """Download use case for downloading MIDIs from a game."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from tqdm import tqdm
 from midi_downloader.domain.entities import MidiFile
 from midi_downloader.domain.repositories import KhinsiderRepository, FileRepository
@@ -11,11 +13,14 @@ from midi_downloader.infrastructure.http.khinsider_client import KhinsiderClient
 class DownloadGameUseCase:
     """Use case for downloading all MIDIs from a game."""
     
+    DEFAULT_MAX_WORKERS = 4
+    
     def __init__(
         self,
         khinsider_repo: KhinsiderRepository,
         file_repo: FileRepository,
-        client: KhinsiderClient
+        client: KhinsiderClient,
+        max_workers: int = DEFAULT_MAX_WORKERS
     ):
         """
         Initialize use case with dependencies.
@@ -24,28 +29,40 @@ class DownloadGameUseCase:
             khinsider_repo: Repository for khinsider data
             file_repo: Repository for file operations
             client: HTTP client for downloads
+            max_workers: Maximum number of concurrent downloads
         """
         self.khinsider_repo = khinsider_repo
         self.file_repo = file_repo
         self.client = client
+        self.max_workers = max(1, max_workers)
     
     def execute(
         self,
         game_url: str,
         output_dir: Path,
-        resume: bool = False
+        resume: bool = False,
+        cancel_event: Optional[threading.Event] = None
     ) -> List[MidiFile]:
         """
         Download all MIDI files from a game.
         
+        Downloads run concurrently on up to ``max_workers`` threads; the
+        shared client still enforces the request rate limit.
+        
         Args:
             game_url: URL of the game page
             output_dir: Directory to save files
             resume: Skip already downloaded files
+            cancel_event: When set, downloads not yet started are skipped
             
         Returns:
             List of successfully downloaded MidiFile objects
         """
+        if cancel_event is None:
+            cancel_event = threading.Event()
+        elif cancel_event.is_set():
+            return []
+        
         # Get MIDI file list
         midi_files = self.khinsider_repo.get_midi_files_for_game(game_url)
         
@@ -56,27 +73,108 @@ class DownloadGameUseCase:
         # Create output directory
         self.file_repo.create_directory(output_dir)
         
-        downloaded = []
+        # Scan the directory once instead of stat-ing every file
+        existing = self.file_repo.list_files(output_dir) if resume else set()
         
-        # Download with tqdm progress bar (Context7 pattern)
-        with tqdm(midi_files, desc="Downloading MIDIs", unit="file") as pbar:
-            for midi in pbar:
-                pbar.set_postfix_str(f"{midi.name[:30]}...")
-                
-                file_path = output_dir / midi.filename
-                
+        pending = []
+        for midi in midi_files:
+            if midi.filename in existing:
                 # Skip if resuming and file exists
-                if resume and self.file_repo.file_exists(file_path):
-                    midi.mark_downloaded()
-                    downloaded.append(midi)
-                    continue
-                
-                # Download file
-                content = self.client.get(midi.url)
-                if content:
-                    if self.file_repo.save_file(content, file_path):
-                        midi.size_bytes = len(content)
-                        midi.mark_downloaded()
-                        downloaded.append(midi)
-        
-        return downloaded
+                midi.mark_downloaded()
+            else:
+                pending.append(midi)
+        
+        # Dispatch flat URL/path lists, then write results back in one pass
+        urls = [midi.url for midi in pending]
+        paths = [output_dir / midi.filename for midi in pending]
+        sizes = self._download_batch(
+            urls, paths, cancel_event, skipped=len(midi_files) - len(pending)
+        )
+        
+        for midi, size in zip(pending, sizes):
+            if size:
+                midi.size_bytes = size
+                midi.mark_downloaded()
+        
+        # Keep the page order rather than completion order
+        return [midi for midi in midi_files if midi.downloaded]
+    
+    def _download_batch(
+        self,
+        urls: List[str],
+        paths: List[Path],
+        cancel_event: threading.Event,
+        skipped: int = 0
+    ) -> List[int]:
+        """
+        Download URLs to their paths concurrently.
+        
+        Args:
+            urls: URLs to download
+            paths: Target file path for each URL
+            cancel_event: When set, downloads not yet started are skipped
+            skipped: Files already on disk, counted as done in the progress bar
+            
+        Returns:
+            Bytes written for each URL, 0 where the download failed
+        """
+        sizes = [0] * len(urls)
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._download_one, url, path, cancel_event): index
+                for index, (url, path) in enumerate(zip(urls, paths))
+            }
+            
+            try:
+                # Download with tqdm progress bar (Context7 pattern)
+                with tqdm(
+                    as_completed(futures),
+                    initial=skipped,
+                    total=skipped + len(futures),
+                    desc="Downloading MIDIs",
+                    unit="file",
+                    mininterval=0.25,
+                    miniters=1,
+                    leave=False
+                ) as pbar:
+                    for future in pbar:
+                        index = futures[future]
+                        # Let tqdm decide when to redraw
+                        pbar.set_postfix_str(
+                            f"{paths[index].name[:30]}...", refresh=False
+                        )
+                        sizes[index] = future.result()
+            except BaseException:
+                # Don't drain queued downloads on Ctrl+C or a worker error
+                cancel_event.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+        
+        return sizes
+    
+    def _download_one(
+        self,
+        url: str,
+        file_path: Path,
+        cancel_event: threading.Event
+    ) -> int:
+        """
+        Stream a single file straight to disk.
+        
+        Args:
+            url: URL to download
+            file_path: Path to save the file
+            cancel_event: When set, the download is skipped
+            
+        Returns:
+            Bytes written, or 0 on failure or cancellation
+        """
+        if cancel_event.is_set():
+            return 0
+        
+        chunks = self.client.stream(url)
+        if chunks is None:
+            return 0
+        
+        return self.file_repo.save_stream(chunks, file_path)
@@ -1,5 +1,7 @@
 """Download use case for downloading MIDIs from an entire system."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List
 from tqdm import tqdm
@@ -11,10 +13,13 @@ from midi_downloader.application.use_cases.download_game_use_case import Downloa
 class DownloadSystemUseCase:
     """Use case for downloading all MIDIs from a gaming system."""
     
+    DEFAULT_MAX_WORKERS = 4
+    
     def __init__(
         self,
         khinsider_repo: KhinsiderRepository,
-        download_game_use_case: DownloadGameUseCase
+        download_game_use_case: DownloadGameUseCase,
+        max_workers: int = DEFAULT_MAX_WORKERS
     ):
         """
         Initialize use case with dependencies.
@@ -22,9 +27,11 @@ class DownloadSystemUseCase:
         Args:
             khinsider_repo: Repository for khinsider data
             download_game_use_case: Use case for downloading individual games
+            max_workers: Maximum number of games processed concurrently
         """
         self.khinsider_repo = khinsider_repo
         self.download_game_use_case = download_game_use_case
+        self.max_workers = max(1, max_workers)
     
     def execute(
         self,
@@ -35,6 +42,9 @@ class DownloadSystemUseCase:
         """
         Download all MIDI files from a gaming system.
         
+        Games are processed concurrently on up to ``max_workers`` threads
+        sharing the same rate-limited client.
+        
         Args:
             system_name: Name of the gaming system (e.g., 'gameboy')
             output_dir: Base directory to save files
@@ -56,16 +66,40 @@ class DownloadSystemUseCase:
         system_dir = output_dir / system_name
         system_dir.mkdir(parents=True, exist_ok=True)
         
-        # Download each game with progress tracking
-        with tqdm(games, desc=f"Processing {system_name}", unit="game") as pbar:
-            for game in pbar:
-                pbar.set_postfix_str(f"{game.name[:30]}...")
-                
-                game_dir = system_dir / game.name
-                game.midi_files = self.download_game_use_case.execute(
+        # Shared with every game so an interrupt also stops running games
+        cancel_event = threading.Event()
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.download_game_use_case.execute,
                     game.url,
-                    game_dir,
-                    resume=resume
-                )
+                    system_dir / game.name,
+                    resume=resume,
+                    cancel_event=cancel_event
+                ): game
+                for game in games
+            }
+            
+            try:
+                # Download each game with progress tracking
+                with tqdm(
+                    as_completed(futures),
+                    total=len(futures),
+                    desc=f"Processing {system_name}",
+                    unit="game",
+                    mininterval=0.25,
+                    miniters=1
+                ) as pbar:
+                    for future in pbar:
+                        game = futures[future]
+                        # Let tqdm decide when to redraw
+                        pbar.set_postfix_str(f"{game.name[:30]}...", refresh=False)
+                        game.midi_files = future.result()
+            except BaseException:
+                # Don't drain queued games on Ctrl+C or a worker error
+                cancel_event.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
         
         return games
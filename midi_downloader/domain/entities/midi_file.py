@@ -1,6 +1,6 @@
 """Domain entity representing a MIDI file."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -13,13 +13,19 @@ class MidiFile:
     system: str
     size_bytes: int = 0
     downloaded: bool = False
+    _filename: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Compute the filename once; use dataclasses.replace() to change the URL."""
+        if self.url:
+            self._filename = self.url.rsplit('/', 1)[-1]
+        else:
+            self._filename = f"{self.name}.mid"
     
     @property
     def filename(self) -> str:
         """Extract filename from URL or use name."""
-        if self.url:
-            return self.url.split('/')[-1]
-        return f"{self.name}.mid"
+        return self._filename
     
     def mark_downloaded(self) -> None:
         """Mark this file as downloaded."""
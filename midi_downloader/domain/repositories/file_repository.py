@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Iterable, Set
 
 
 class FileRepository(ABC):
@@ -12,11 +13,21 @@ class FileRepository(ABC):
         """Save binary content to a file."""
         pass
     
+    @abstractmethod
+    def save_stream(self, chunks: Iterable[bytes], file_path: Path) -> int:
+        """Save streamed binary chunks to a file, returning bytes written."""
+        pass
+    
     @abstractmethod
     def file_exists(self, file_path: Path) -> bool:
         """Check if a file exists."""
         pass
     
+    @abstractmethod
+    def list_files(self, dir_path: Path) -> Set[str]:
+        """List the names of files in a directory."""
+        pass
+    
     @abstractmethod
     def create_directory(self, dir_path: Path) -> bool:
         """Create a directory if it doesn't exist."""
@@ -1,22 +1,79 @@
 """HTTP client for khinsider.com using cloudscraper to bypass Cloudflare."""
 
-import time
+import socket
+import threading
 import cloudscraper
-from typing import Optional
-from urllib3.util import Retry
+from cloudscraper.exceptions import CloudflareException
+from requests_cache import CachedSession, DO_NOT_CACHE
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib3.util import Retry, connection as urllib3_connection
+from requests import Response
 from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from midi_downloader.infrastructure.http.rate_limiter import TokenBucket
+
+
+# Pre-resolved (host, port) -> IP addresses, consulted for every new connection
+_DNS_CACHE: Dict[Tuple[str, int], List[str]] = {}
+_original_create_connection = urllib3_connection.create_connection
+
+
+def _cached_create_connection(
+    address: Tuple[str, int], *args: Any, **kwargs: Any
+) -> socket.socket:
+    """
+    Open a connection trying each pinned address of a pre-resolved host.
+    
+    Falls back to resolving the hostname again if none of them connect.
+    """
+    host, port = address
+    for ip in _DNS_CACHE.get((host, port), ()):
+        try:
+            return _original_create_connection((ip, port), *args, **kwargs)
+        except OSError:
+            continue
+    return _original_create_connection(address, *args, **kwargs)
+
+
+class NotModified:
+    """Sentinel type for a conditional request answered with 304."""
+    
+    def __repr__(self) -> str:
+        return 'NOT_MODIFIED'
+
+
+NOT_MODIFIED = NotModified()
 
 
 class KhinsiderClient:
     """HTTP client with automatic retries and rate limiting."""
     
+    # All traffic targets www.khinsider.com, so a single pool sized for the
+    # download workers keeps warm TLS connections instead of reopening them.
+    POOL_CONNECTIONS = 1
+    POOL_MAXSIZE = 64
+    
+    HOST = 'www.khinsider.com'
+    SITE_URL = f"https://{HOST}/"
+    
+    # Statuses and body markers of a Cloudflare challenge page
+    CHALLENGE_STATUSES = (403, 503)
+    CHALLENGE_MARKERS = ('/cdn-cgi/challenge-platform/', 'cf_chl_')
+    
+    CHUNK_SIZE = 64 * 1024
+    
+    DEFAULT_CACHE_NAME = '.khinsider_cache'
+    DEFAULT_CACHE_EXPIRE_AFTER = 3600
+    
     def __init__(
         self,
         rate_limit_delay: float = 1.0,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
-        user_agent: Optional[str] = None
+        user_agent: Optional[str] = None,
+        burst: int = 1,
+        cache_name: Optional[str] = DEFAULT_CACHE_NAME,
+        cache_expire_after: int = DEFAULT_CACHE_EXPIRE_AFTER
     ):
         """
         Initialize the HTTP client.
@@ -26,34 +83,66 @@ class KhinsiderClient:
             max_retries: Maximum number of retry attempts
             backoff_factor: Exponential backoff multiplier
             user_agent: Custom user agent string
+            burst: Requests allowed back-to-back before the delay applies
+            cache_name: SQLite cache path for HTML pages, or None to disable
+            cache_expire_after: Seconds a cached page stays fresh
         """
         self.rate_limit_delay = rate_limit_delay
-        self.last_request_time = 0.0
+        self.rate_limiter = TokenBucket(
+            rate=1.0 / rate_limit_delay if rate_limit_delay > 0 else 0.0,
+            capacity=burst
+        )
         
-        # Create cloudscraper session (bypasses Cloudflare)
-        self.session = cloudscraper.create_scraper(
+        # Cloudscraper only solves the Cloudflare challenge; regular traffic
+        # goes through a plain cached session carrying the clearance cookies
+        self._scraper = cloudscraper.create_scraper(
             browser={
                 'browser': 'chrome',
                 'platform': 'windows',
                 'desktop': True
             }
         )
+        self._challenge_lock = threading.Lock()
+        # Bumped on every solve so concurrent callers solve only once
+        self._challenge_generation = 0
+        
+        self.session = CachedSession(
+            cache_name=cache_name or self.DEFAULT_CACHE_NAME,
+            backend='sqlite' if cache_name else 'memory',
+            expire_after=cache_expire_after if cache_name else DO_NOT_CACHE,
+            cache_control=True,
+            allowable_codes=(200,),
+            allowable_methods=('GET',)
+        )
         
         retry_strategy = Retry(
             total=max_retries,
             backoff_factor=backoff_factor,
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=['GET', 'HEAD']
+            allowed_methods=['GET', 'HEAD'],
+            respect_retry_after_header=True,
+            raise_on_status=False
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            pool_block=False,
+            max_retries=retry_strategy
+        )
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
         
-        # Set headers
-        self.session.headers.update({
+        # Set headers (the clearance cookie is bound to the User-Agent, so
+        # both sessions must send the same one)
+        self._scraper.headers.update({
             'User-Agent': user_agent or 'Mozilla/5.0 (compatible; MIDIDownloader/1.0)'
         })
+        self.session.headers.update(self._scraper.headers)
+        self.session.headers['Connection'] = 'keep-alive'
+        
+        self._warm_dns()
+        self._solve_challenge()
     
     def get(self, url: str) -> Optional[bytes]:
         """
@@ -65,44 +154,260 @@ class KhinsiderClient:
         Returns:
             Response content as bytes, or None on failure
         """
-        self._rate_limit()
+        response = self._do_request(url)
+        if response is not None:
+            return response.content
+        return None
+    
+    def get_text(self, url: str) -> Optional[str]:
+        """
+        Make a GET request and return text content.
+        
+        The body is decoded once by requests using the charset from the
+        Content-Type header, falling back to UTF-8 when none is declared.
+        
+        Args:
+            url: URL to request
+            
+        Returns:
+            Response content as string, or None on failure
+        """
+        response = self._do_request(url)
+        if response is None or not response.content:
+            return None
+        return self._decode(response)
+    
+    def get_text_if_modified(
+        self,
+        url: str,
+        validators: Dict[str, str]
+    ) -> Union[str, NotModified, None]:
+        """
+        Make a conditional GET request and return text content.
+        
+        Stored validators are sent as If-None-Match/If-Modified-Since, in
+        which case the response cache is bypassed. Without stored values
+        this behaves like get_text.
+        
+        Args:
+            url: URL to request
+            validators: Stored ``etag``/``last_modified`` values; refreshed
+                in place from a full response
+            
+        Returns:
+            Response content as string, NOT_MODIFIED on a 304 response,
+            or None on failure
+        """
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        
+        response = self._do_request(url, headers=headers)
+        if response is None:
+            return None
+        if response.status_code == 304:
+            return NOT_MODIFIED
+        if not response.content:
+            return None
+        
+        validators['etag'] = response.headers.get('ETag', '')
+        validators['last_modified'] = response.headers.get('Last-Modified', '')
+        return self._decode(response)
+    
+    @staticmethod
+    def _decode(response: Response) -> str:
+        """Decode a response body, defaulting to UTF-8 without a charset."""
+        if 'charset' not in response.headers.get('Content-Type', '').lower():
+            response.encoding = 'utf-8'
+        return response.text
+    
+    def _do_request(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[Response]:
+        """
+        Make a GET request with rate limiting, reading the whole body.
         
+        Fresh cached responses are served without touching the network or
+        the rate limiter. Requests with extra headers (conditional GETs)
+        always go to the network and are not cached.
+        
+        Args:
+            url: URL to request
+            headers: Extra request headers
+            
+        Returns:
+            Successful (or 304) response, or None on failure
+        """
         try:
-            response = self.session.get(url, timeout=30)
+            if headers:
+                self.rate_limiter.acquire()
+                response = self._request(url, headers=headers, cache=False)
+            else:
+                response = self.session.get(url, only_if_cached=True, timeout=30)
+                if response.status_code != 200:
+                    self.rate_limiter.acquire()
+                    response = self._request(url)
             response.raise_for_status()
-            return response.content
+            return response
         except RequestException as e:
             print(f"Request failed for {url}: {e}")
             return None
     
-    def get_text(self, url: str) -> Optional[str]:
+    def stream(self, url: str) -> Optional[Iterator[bytes]]:
         """
-        Make a GET request and return text content.
+        Make a streaming GET request with rate limiting.
+        
+        The body is not read until the returned iterator is consumed, and
+        the connection is released once it is exhausted or closed. Errors
+        raised mid-body propagate to the consumer. Streamed downloads are
+        never cached.
         
         Args:
             url: URL to request
             
         Returns:
-            Response content as string, or None on failure
+            Iterator over response body chunks, or None on failure
         """
-        content = self.get(url)
-        if content:
-            return content.decode('utf-8', errors='ignore')
-        return None
+        self.rate_limiter.acquire()
+        
+        try:
+            response = self._request(url, stream=True)
+            response.raise_for_status()
+        except RequestException as e:
+            print(f"Request failed for {url}: {e}")
+            return None
+        
+        return self._iter_chunks(response)
+    
+    def _request(
+        self,
+        url: str,
+        stream: bool = False,
+        cache: bool = True,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Response:
+        """
+        Send a GET request, re-solving the Cloudflare challenge if needed.
+        
+        On a Cloudflare challenge page the clearance cookies are refreshed
+        (once across concurrent callers) and the request is retried once; if
+        that still fails, cloudscraper itself performs the request as a
+        fallback. Every follow-up request takes its own rate limiter token.
+        An unsolvable challenge is raised as a RequestException.
+        
+        Args:
+            url: URL to request
+            stream: Stream the body instead of reading it (never cached)
+            cache: Read and store the response in the response cache
+            headers: Extra request headers
+            
+        Returns:
+            The final response
+        """
+        expire_after = None if cache and not stream else DO_NOT_CACHE
+        generation = self._challenge_generation
+        response = self.session.get(
+            url, stream=stream, timeout=30, headers=headers,
+            expire_after=expire_after
+        )
+        if not self._is_challenge(response):
+            return response
+        
+        response.close()
+        self._solve_challenge(generation)
+        self.rate_limiter.acquire()
+        response = self.session.get(
+            url, stream=stream, timeout=30, headers=headers,
+            expire_after=expire_after
+        )
+        if not self._is_challenge(response):
+            return response
+        
+        response.close()
+        self.rate_limiter.acquire()
+        try:
+            return self._scraper.get(
+                url, stream=stream, timeout=30, headers=headers
+            )
+        except CloudflareException as e:
+            # Surface as a request error so callers degrade to None
+            raise RequestException(f"Cloudflare challenge failed: {e}") from e
     
-    def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    def _is_challenge(self, response: Response) -> bool:
+        """Check whether a response is a Cloudflare challenge page."""
+        if response.status_code not in self.CHALLENGE_STATUSES:
+            return False
+        if response.headers.get('cf-mitigated', '').lower() == 'challenge':
+            return True
+        if not response.headers.get('Server', '').lower().startswith('cloudflare'):
+            return False
         
-        if time_since_last < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - time_since_last)
+        body = response.text
+        return any(marker in body for marker in self.CHALLENGE_MARKERS)
+    
+    def _solve_challenge(self, seen_generation: Optional[int] = None) -> None:
+        """
+        Solve the Cloudflare challenge once and share its cookies.
+        
+        Args:
+            seen_generation: Challenge generation observed before the failed
+                request; the solve is skipped if another caller has already
+                refreshed the cookies since then
+        """
+        with self._challenge_lock:
+            if (
+                seen_generation is not None
+                and seen_generation != self._challenge_generation
+            ):
+                return
+            self._challenge_generation += 1
+            
+            self.rate_limiter.acquire()
+            try:
+                self._scraper.get(self.SITE_URL, timeout=30).close()
+            except (RequestException, CloudflareException) as e:
+                print(f"Cloudflare challenge failed for {self.SITE_URL}: {e}")
+                return
+            self.session.cookies.update(self._scraper.cookies)
+    
+    def _iter_chunks(self, response: Response) -> Iterator[bytes]:
+        """Yield body chunks and release the connection afterwards."""
+        try:
+            yield from response.iter_content(chunk_size=self.CHUNK_SIZE)
+        finally:
+            response.close()
+    
+    def _warm_dns(self) -> None:
+        """
+        Resolve the khinsider host once and pin it for the whole session.
+        
+        TLS still verifies against the hostname; only the socket connect
+        uses the cached addresses, tried in resolver order and limited to
+        the address families urllib3 would use. Resolution failures fall
+        back to the system resolver on each connection.
+        """
+        family = urllib3_connection.allowed_gai_family()
+        for port in (80, 443):
+            try:
+                addr_info = socket.getaddrinfo(
+                    self.HOST, port, family, socket.SOCK_STREAM
+                )
+            except OSError:
+                return
+            addresses = list(dict.fromkeys(str(info[4][0]) for info in addr_info))
+            if addresses:
+                _DNS_CACHE[(self.HOST, port)] = addresses
         
-        self.last_request_time = time.time()
+        urllib3_connection.create_connection = _cached_create_connection
     
     def close(self) -> None:
-        """Close the session."""
+        """Close the sessions."""
         self.session.close()
+        self._scraper.close()
     
     def __enter__(self):
         """Context manager support."""
@@ -0,0 +1,45 @@
+"""Thread-safe token bucket rate limiter."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Token bucket shared by all threads issuing requests."""
+    
+    def __init__(self, rate: float, capacity: int = 1):
+        """
+        Initialize the token bucket.
+        
+        Args:
+            rate: Tokens added per second (0 disables limiting)
+            capacity: Maximum number of tokens, i.e. the allowed burst
+        """
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """
+        Take one token, sleeping until it becomes available.
+        
+        The token is reserved under the lock and the wait happens outside
+        of it, so callers are served in order without serializing on sleep.
+        """
+        if self.rate <= 0:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
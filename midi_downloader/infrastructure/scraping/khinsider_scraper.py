@@ -1,7 +1,10 @@
-"""Web scraper for khinsider.com using BeautifulSoup."""
+"""Web scraper for khinsider.com using lxml and BeautifulSoup."""
 
-from typing import List, Optional
+from html import unescape
+from typing import Iterator, Optional
+from urllib.parse import urldefrag, urljoin, urlparse
 from bs4 import BeautifulSoup
+from lxml import etree, html
 from midi_downloader.domain.entities import Game, MidiFile, GameSystem
 
 
@@ -9,48 +12,66 @@ class KhinsiderScraper:
     """Scrapes khinsider.com for MIDI information."""
     
     BASE_URL = "https://www.khinsider.com/midi"
+    SITE_URL = "https://www.khinsider.com/"
     
-    def parse_game_list(self, html_content: str, system_name: str) -> List[Game]:
+    DOWNLOAD_LINK_TEXT = "Click here to download"
+    
+    def __init__(self):
+        """Compile the XPath expressions used on every parsed page."""
+        # Rows of the first table, skipping the header row (Context7 pattern)
+        self._game_rows = etree.XPath(
+            "((//table)[1]//tr)[position() > 1][count(td) >= 2]"
+        )
+        # Table with MIDI downloads - it has no ID, just use the first table
+        self._midi_rows = etree.XPath("(//table)[1]//tr[count(td) >= 2]")
+        # First link in the first cell of a row
+        self._row_link = etree.XPath("(./td[1]//a)[1]")
+    
+    def parse_game_list(
+        self,
+        html_content: str,
+        system_name: str,
+        page_url: Optional[str] = None
+    ) -> Iterator[Game]:
         """
         Parse game list page for a system.
         
         Args:
             html_content: HTML content of the system page
             system_name: Name of the gaming system
+            page_url: URL of the page, used to resolve relative links
+                (defaults to the site root)
             
-        Returns:
-            List of Game objects
+        Yields:
+            Game objects in page order
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        games = []
-        
-        # Find the table containing games
-        table = soup.find('table')
-        if not table:
-            return games
+        tree = self._parse_html(html_content)
+        if tree is None:
+            return
         
-        # Find all rows (Context7 pattern for table parsing)
-        rows = table.find_all('tr')[1:]  # Skip header row
-        
-        for row in rows:
-            cells = row.find_all('td')
-            if len(cells) >= 2:
-                link = cells[0].find('a')
-                if link:
-                    game_name = link.text.strip()
-                    game_url = link.get('href', '')
-                    if game_url.startswith('/'):
-                        game_url = f"https://www.khinsider.com{game_url}"
-                    
-                    games.append(Game(
-                        name=game_name,
-                        url=game_url,
-                        system=system_name
-                    ))
-        
-        return games
+        for row in self._game_rows(tree):
+            links = self._row_link(row)
+            if links:
+                link = links[0]
+                game_name = link.text_content().strip()
+                href = link.get('href')
+                if not href:
+                    continue
+                game_url = urljoin(page_url or self.SITE_URL, href)
+                
+                yield Game(
+                    name=game_name,
+                    url=game_url,
+                    system=system_name
+                )
     
-    def parse_midi_list(self, html_content: str, game_name: str, system_name: str) -> List[MidiFile]:
+    def parse_midi_list(
+        self,
+        html_content: str,
+        game_name: str,
+        system_name: str,
+        page_url: Optional[str] = None
+    ) -> Iterator[MidiFile]:
         """
         Parse MIDI file list for a game.
         
@@ -58,64 +79,135 @@ class KhinsiderScraper:
             html_content: HTML content of the game page
             game_name: Name of the game
             system_name: Name of the system
+            page_url: URL of the page, used to resolve relative links
+                (defaults to the site root)
             
-        Returns:
-            List of MidiFile objects
+        Yields:
+            MidiFile objects in page order
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        midi_files = []
+        tree = self._parse_html(html_content)
+        if tree is None:
+            return
         
-        # Find table with MIDI downloads - it has no ID, just find the first table
-        table = soup.find('table')
-        if not table:
-            return midi_files
-        
-        rows = table.find_all('tr')
-        
-        for row in rows:
-            cells = row.find_all('td')
-            if len(cells) >= 2:
-                # First cell has the MIDI file link
-                link = cells[0].find('a')
-                if link:
-                    midi_name = link.text.strip()
-                    midi_url = link.get('href', '')
-                    
-                    # The link goes directly to .mid file, not a detail page
-                    if midi_url.startswith('//'):
-                        midi_url = f"https:{midi_url}"
-                    elif midi_url.startswith('/'):
-                        midi_url = f"https://www.khinsider.com{midi_url}"
-                    
-                    # Only add if it's a .mid file
-                    if '.mid' in midi_url:
-                        midi_files.append(MidiFile(
-                            name=midi_name,
-                            url=midi_url,  # Direct download URL
-                            game_name=game_name,
-                            system=system_name
-                        ))
-        
-        return midi_files
+        base_url = page_url or self.SITE_URL
+        for row in self._midi_rows(tree):
+            # First cell has the MIDI file link
+            links = self._row_link(row)
+            if links:
+                link = links[0]
+                midi_name = link.text_content().strip()
+                href = link.get('href')
+                if not href:
+                    continue
+                # The link goes directly to .mid file, not a detail page
+                midi_url = urljoin(base_url, href)
+                # Same-page links (e.g. "#top") would resolve to the page itself
+                if urldefrag(midi_url).url == urldefrag(base_url).url:
+                    continue
+                
+                # Only add if it's a .mid file
+                if '.mid' in midi_url:
+                    yield MidiFile(
+                        name=midi_name,
+                        url=midi_url,  # Direct download URL
+                        game_name=game_name,
+                        system=system_name
+                    )
     
-    def parse_midi_download_url(self, html_content: str) -> Optional[str]:
+    def parse_midi_download_url(
+        self,
+        html_content: str,
+        page_url: Optional[str] = None
+    ) -> Optional[str]:
         """
         Parse the actual MIDI download URL from a MIDI detail page.
         
         Args:
             html_content: HTML content of the MIDI detail page
+            page_url: URL of the page, used to resolve relative links
+                (defaults to the site root)
             
         Returns:
             Direct download URL or None
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        base_url = page_url or self.SITE_URL
+        
+        url = self._find_download_href(html_content, base_url)
+        if url:
+            return url
+        
+        # Fall back to a full parse for markup the fast path can't read
+        soup = BeautifulSoup(html_content, 'lxml')
         
         # Find download link (usually marked with a distinct class or id)
-        download_link = soup.find('a', string=lambda text: text and 'Click here to download' in text)
+        download_link = soup.find(
+            'a', string=lambda text: text and self.DOWNLOAD_LINK_TEXT in text
+        )
         if download_link:
-            url = download_link.get('href', '')
-            if url.startswith('//'):
-                url = f"https:{url}"
-            return url
+            href = download_link.get('href')
+            if isinstance(href, str) and href:
+                return urljoin(base_url, href)
         
         return None
+    
+    def _find_download_href(self, html_content: str, base_url: str) -> Optional[str]:
+        """
+        Locate the download link's href with plain string searches.
+        
+        Args:
+            html_content: HTML content of the MIDI detail page
+            base_url: URL relative hrefs are resolved against
+            
+        Returns:
+            Absolute http(s) URL, or None if the link isn't found this way
+        """
+        text_idx = html_content.find(self.DOWNLOAD_LINK_TEXT)
+        if text_idx < 0:
+            return None
+        
+        # The href must belong to the anchor that wraps the link text; skip
+        # look-alike attributes such as data-href or xlink:href
+        href_idx = html_content.rfind('href="', 0, text_idx)
+        while href_idx > 0 and not html_content[href_idx - 1].isspace():
+            href_idx = html_content.rfind('href="', 0, href_idx)
+        if href_idx <= 0 or html_content.rfind('<a', 0, text_idx) > href_idx:
+            return None
+        tag_idx = html_content.rfind('<', 0, href_idx)
+        tag_open = html_content[tag_idx:tag_idx + 3]
+        if tag_idx < 0 or len(tag_open) < 3 or tag_open[:2].lower() != '<a':
+            return None
+        if not tag_open[2].isspace():
+            return None
+        if html_content.find('</a>', href_idx, text_idx) >= 0:
+            return None
+        
+        start = href_idx + len('href="')
+        end = html_content.find('"', start, text_idx)
+        if end < 0:
+            return None
+        
+        url = urljoin(base_url, unescape(html_content[start:end]))
+        parsed = urlparse(url)
+        if parsed.scheme in ('http', 'https') and parsed.netloc:
+            return url
+        return None
+    
+    @staticmethod
+    def _parse_html(html_content: str) -> Optional[html.HtmlElement]:
+        """Parse HTML with lxml, returning None for empty or unparsable input."""
+        try:
+            return html.fromstring(html_content)
+        except etree.ParserError:
+            return None
+        except ValueError:
+            # lxml rejects str input that carries an XML encoding declaration;
+            # parse the UTF-8 bytes instead, ignoring the declared encoding
+            pass
+        
+        try:
+            return html.fromstring(
+                html_content.encode('utf-8'),
+                parser=html.HTMLParser(encoding='utf-8')
+            )
+        except etree.ParserError:
+            return None
@@ -1,27 +1,96 @@
 """File system repository implementation."""
 
+import os
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Set
 from midi_downloader.domain.repositories import FileRepository
 
 
 class FileSystemRepository(FileRepository):
     """Concrete implementation of FileRepository using pathlib."""
     
+    BUFFER_SIZE = 1 << 16
+    
     def save_file(self, content: bytes, file_path: Path) -> bool:
-        """Save binary content to a file."""
+        """Save binary content to a file atomically."""
         try:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_bytes(content)
+            self._write_atomic((content,), file_path)
             return True
         except Exception as e:
             print(f"Failed to save file {file_path}: {e}")
             return False
     
+    def save_stream(self, chunks: Iterable[bytes], file_path: Path) -> int:
+        """
+        Save streamed binary chunks to a file atomically.
+        
+        An empty stream is discarded rather than saved, so resume never
+        mistakes an empty download for a finished file.
+        
+        Returns:
+            Number of bytes written, or 0 on failure or an empty stream
+        """
+        try:
+            return self._write_atomic(chunks, file_path, keep_empty=False)
+        except Exception as e:
+            print(f"Failed to save file {file_path}: {e}")
+            return 0
+    
+    def _write_atomic(
+        self,
+        chunks: Iterable[bytes],
+        file_path: Path,
+        keep_empty: bool = True
+    ) -> int:
+        """
+        Write chunks to a temporary ``.part`` file, then rename it over the
+        target so an interrupted write never looks finished to resume.
+        
+        The temporary name is unique, so concurrent writers targeting the
+        same path never share it; the last rename wins.
+        
+        Args:
+            chunks: Binary chunks to write
+            file_path: Target file path
+            keep_empty: Replace the target even when no bytes were written
+        
+        Returns:
+            Number of bytes written
+        """
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=file_path.parent, prefix=f"{file_path.name}.", suffix='.part'
+        )
+        try:
+            size = 0
+            with os.fdopen(fd, 'wb', buffering=self.BUFFER_SIZE) as fh:
+                for chunk in chunks:
+                    fh.write(chunk)
+                    size += len(chunk)
+            if not size and not keep_empty:
+                Path(tmp_name).unlink(missing_ok=True)
+                return 0
+            # mkstemp creates owner-only files; use regular file permissions
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, file_path)
+            return size
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    
     def file_exists(self, file_path: Path) -> bool:
         """Check if a file exists."""
         return file_path.exists() and file_path.is_file()
     
+    def list_files(self, dir_path: Path) -> Set[str]:
+        """List the names of files in a directory with a single scan."""
+        try:
+            with os.scandir(dir_path) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return set()
+    
     def create_directory(self, dir_path: Path) -> bool:
         """Create a directory if it doesn't exist."""
         try:
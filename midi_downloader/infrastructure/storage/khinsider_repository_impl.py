@@ -1,25 +1,45 @@
 """Khinsider repository implementation."""
 
-from typing import List
+import json
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
 from midi_downloader.domain.entities import Game, GameSystem, MidiFile
 from midi_downloader.domain.repositories import KhinsiderRepository
-from midi_downloader.infrastructure.http.khinsider_client import KhinsiderClient
+from midi_downloader.infrastructure.http.khinsider_client import (
+    KhinsiderClient,
+    NotModified,
+)
 from midi_downloader.infrastructure.scraping.khinsider_scraper import KhinsiderScraper
+from midi_downloader.infrastructure.storage.file_system_repository import (
+    FileSystemRepository,
+)
 
 
 class KhinsiderRepositoryImpl(KhinsiderRepository):
     """Concrete implementation of KhinsiderRepository."""
     
-    def __init__(self, client: KhinsiderClient, scraper: KhinsiderScraper):
+    MIDI_EXTENSIONS = ('.mid', '.midi')
+    
+    def __init__(
+        self,
+        client: KhinsiderClient,
+        scraper: KhinsiderScraper,
+        listing_cache_path: Optional[Path] = None
+    ):
         """
         Initialize repository with dependencies.
         
         Args:
             client: HTTP client for making requests
             scraper: Scraper for parsing HTML
+            listing_cache_path: JSON file storing parsed system listings and
+                their ETag/Last-Modified validators, or None to disable
         """
         self.client = client
         self.scraper = scraper
+        self.listing_cache_path = listing_cache_path
     
     def get_systems(self) -> List[GameSystem]:
         """Retrieve all available gaming systems."""
@@ -28,13 +48,54 @@ class KhinsiderRepositoryImpl(KhinsiderRepository):
         return []
     
     def get_games_for_system(self, system_name: str) -> List[Game]:
-        """Retrieve all games for a specific system."""
+        """
+        Retrieve all games for a specific system.
+        
+        With a listing cache, the page is fetched conditionally and an
+        unchanged (304) listing is loaded from the cache without parsing.
+        """
         url = f"{self.scraper.BASE_URL}/{system_name}"
-        html = self.client.get_text(url)
         
-        if html:
-            return self.scraper.parse_game_list(html, system_name)
-        return []
+        cache_path = self.listing_cache_path
+        if cache_path is None:
+            html = self.client.get_text(url)
+            if html:
+                return list(self.scraper.parse_game_list(html, system_name, url))
+            return []
+        
+        listings = self._load_listings(cache_path)
+        entry = listings.get(url)
+        if entry and entry.get('system') != system_name:
+            entry = None
+        
+        validators = {
+            'etag': entry.get('etag', '') if entry else '',
+            'last_modified': entry.get('last_modified', '') if entry else ''
+        }
+        page = self.client.get_text_if_modified(url, validators)
+        
+        if isinstance(page, NotModified):
+            if not entry:
+                return []
+            return [
+                Game(name=game['name'], url=game['url'], system=system_name)
+                for game in entry.get('games', [])
+            ]
+        if not page:
+            return []
+        
+        games = list(self.scraper.parse_game_list(page, system_name, url))
+        
+        if validators['etag'] or validators['last_modified']:
+            listings[url] = {
+                'system': system_name,
+                'etag': validators['etag'],
+                'last_modified': validators['last_modified'],
+                'games': [{'name': game.name, 'url': game.url} for game in games]
+            }
+            self._save_listings(cache_path, listings)
+        
+        return games
     
     def get_midi_files_for_game(self, game_url: str) -> List[MidiFile]:
         """Retrieve all MIDI files for a specific game."""
@@ -49,14 +110,45 @@ class KhinsiderRepositoryImpl(KhinsiderRepository):
         game_name = parts[-1] if len(parts) > 0 else "unknown"
         system_name = parts[-2] if len(parts) > 1 else "unknown"
         
-        midi_list = self.scraper.parse_midi_list(html, game_name, system_name)
+        midi_files = []
         
-        # Resolve actual download URLs
-        for midi in midi_list:
-            detail_html = self.client.get_text(midi.url)
-            if detail_html:
-                download_url = self.scraper.parse_midi_download_url(detail_html)
-                if download_url:
-                    midi.url = download_url
+        # Resolve actual download URLs while parsing; direct MIDI links need
+        # no detail page
+        for midi in self.scraper.parse_midi_list(
+            html, game_name, system_name, game_url
+        ):
+            if self._is_detail_page(midi.url):
+                detail_html = self.client.get_text(midi.url)
+                if detail_html:
+                    download_url = self.scraper.parse_midi_download_url(
+                        detail_html, midi.url
+                    )
+                    if download_url:
+                        # Rebuild so the cached filename follows the new URL
+                        midi = replace(midi, url=download_url)
+            
+            midi_files.append(midi)
         
-        return midi_list
+        return midi_files
+    
+    def _is_detail_page(self, url: str) -> bool:
+        """Check whether a listed URL is a khinsider page, not a MIDI file."""
+        parsed = urlparse(url)
+        site = urlparse(self.scraper.SITE_URL)
+        if parsed.scheme != site.scheme or parsed.netloc != site.netloc:
+            return False
+        return not parsed.path.lower().endswith(self.MIDI_EXTENSIONS)
+    
+    def _load_listings(self, cache_path: Path) -> Dict[str, dict]:
+        """Load cached system listings, ignoring a missing or corrupt file."""
+        try:
+            with open(cache_path, encoding='utf-8') as fh:
+                listings = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+        return listings if isinstance(listings, dict) else {}
+    
+    def _save_listings(self, cache_path: Path, listings: Dict[str, dict]) -> None:
+        """Persist cached system listings atomically."""
+        content = json.dumps(listings, ensure_ascii=False, indent=2)
+        FileSystemRepository().save_file(content.encode('utf-8'), cache_path)
@@ -0,0 +1,181 @@
+"""Unit tests for the game and system download use cases."""
+
+import threading
+from unittest.mock import Mock
+import pytest
+from midi_downloader.application.use_cases.download_game_use_case import (
+    DownloadGameUseCase,
+)
+from midi_downloader.application.use_cases.download_system_use_case import (
+    DownloadSystemUseCase,
+)
+from midi_downloader.domain.entities import Game, MidiFile
+from midi_downloader.infrastructure.storage.file_system_repository import (
+    FileSystemRepository,
+)
+
+GAME_URL = "https://www.khinsider.com/midi/gameboy/zelda"
+
+
+def _midi(name):
+    """Build a MIDI file listed on the test game page."""
+    return MidiFile(
+        name=name, url=f"{GAME_URL}/{name}.mid", game_name="zelda", system="gameboy"
+    )
+
+
+@pytest.fixture
+def khinsider_repo():
+    """Provide a repository listing three MIDI files."""
+    repo = Mock()
+    repo.get_midi_files_for_game.side_effect = lambda url: [
+        _midi("a"),
+        _midi("b"),
+        _midi("c"),
+    ]
+    return repo
+
+
+@pytest.fixture
+def client():
+    """Provide a client streaming a small body for every URL."""
+    client = Mock()
+    client.stream.side_effect = lambda url: iter([b"MThd"])
+    return client
+
+
+@pytest.fixture
+def use_case(khinsider_repo, client):
+    """Provide a game download use case writing to the real file system."""
+    return DownloadGameUseCase(
+        khinsider_repo, FileSystemRepository(), client, max_workers=2
+    )
+
+
+def _streamed(client):
+    """Return the URLs streamed by a mocked client, sorted."""
+    return sorted(call.args[0] for call in client.stream.call_args_list)
+
+
+class TestDownloadGameUseCase:
+    """Tests for downloading every MIDI file of a game."""
+
+    def test_downloads_all_files_in_page_order(self, use_case, client, tmp_path):
+        midis = use_case.execute(GAME_URL, tmp_path)
+
+        assert [midi.filename for midi in midis] == ["a.mid", "b.mid", "c.mid"]
+        assert all(midi.downloaded and midi.size_bytes == 4 for midi in midis)
+        assert (tmp_path / "b.mid").read_bytes() == b"MThd"
+        assert len(_streamed(client)) == 3
+
+    def test_resume_skips_files_already_on_disk(self, use_case, client, tmp_path):
+        (tmp_path / "b.mid").write_bytes(b"done")
+
+        midis = use_case.execute(GAME_URL, tmp_path, resume=True)
+
+        assert _streamed(client) == [f"{GAME_URL}/a.mid", f"{GAME_URL}/c.mid"]
+        assert [midi.filename for midi in midis] == ["a.mid", "b.mid", "c.mid"]
+        assert (tmp_path / "b.mid").read_bytes() == b"done"
+
+    def test_without_resume_existing_files_are_downloaded_again(
+        self, use_case, client, tmp_path
+    ):
+        (tmp_path / "b.mid").write_bytes(b"done")
+
+        use_case.execute(GAME_URL, tmp_path)
+
+        assert len(_streamed(client)) == 3
+        assert (tmp_path / "b.mid").read_bytes() == b"MThd"
+
+    def test_failed_and_empty_downloads_are_not_marked(
+        self, use_case, client, tmp_path
+    ):
+        bodies = {f"{GAME_URL}/a.mid": None, f"{GAME_URL}/b.mid": iter([])}
+        client.stream.side_effect = lambda url: bodies.get(url, iter([b"MThd"]))
+
+        midis = use_case.execute(GAME_URL, tmp_path)
+
+        assert [midi.filename for midi in midis] == ["c.mid"]
+        assert FileSystemRepository().list_files(tmp_path) == {"c.mid"}
+
+    def test_resume_retries_previously_empty_download(self, use_case, client, tmp_path):
+        client.stream.side_effect = lambda url: iter([])
+        use_case.execute(GAME_URL, tmp_path)
+        client.stream.side_effect = lambda url: iter([b"MThd"])
+
+        midis = use_case.execute(GAME_URL, tmp_path, resume=True)
+
+        assert len(midis) == 3
+        assert (tmp_path / "a.mid").read_bytes() == b"MThd"
+
+    def test_no_midi_files_returns_empty(self, use_case, khinsider_repo, tmp_path):
+        khinsider_repo.get_midi_files_for_game.side_effect = None
+        khinsider_repo.get_midi_files_for_game.return_value = []
+
+        assert use_case.execute(GAME_URL, tmp_path) == []
+
+    def test_set_cancel_event_skips_the_game(
+        self, use_case, khinsider_repo, client, tmp_path
+    ):
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        assert use_case.execute(GAME_URL, tmp_path, cancel_event=cancel_event) == []
+        khinsider_repo.get_midi_files_for_game.assert_not_called()
+        client.stream.assert_not_called()
+
+    def test_cancel_event_set_mid_game_skips_remaining_files(
+        self, khinsider_repo, client, tmp_path
+    ):
+        cancel_event = threading.Event()
+
+        def stream(url):
+            cancel_event.set()
+            return iter([b"MThd"])
+
+        client.stream.side_effect = stream
+        use_case = DownloadGameUseCase(
+            khinsider_repo, FileSystemRepository(), client, max_workers=1
+        )
+
+        midis = use_case.execute(GAME_URL, tmp_path, cancel_event=cancel_event)
+
+        assert [midi.filename for midi in midis] == ["a.mid"]
+        assert client.stream.call_count == 1
+
+    def test_worker_error_propagates_and_sets_cancel_event(self, client, tmp_path):
+        khinsider_repo = Mock()
+        khinsider_repo.get_midi_files_for_game.return_value = [_midi("a")]
+        client.stream.side_effect = RuntimeError("boom")
+        use_case = DownloadGameUseCase(khinsider_repo, FileSystemRepository(), client)
+        cancel_event = threading.Event()
+
+        with pytest.raises(RuntimeError):
+            use_case.execute(GAME_URL, tmp_path, cancel_event=cancel_event)
+
+        assert cancel_event.is_set()
+
+
+class TestDownloadSystemUseCase:
+    """Tests for downloading every game of a system."""
+
+    def test_each_game_gets_its_own_directory_and_shared_cancel_event(self, tmp_path):
+        khinsider_repo = Mock()
+        khinsider_repo.get_games_for_system.return_value = [
+            Game(name="zelda", url=GAME_URL, system="gameboy"),
+            Game(name="tetris", url=f"{GAME_URL}-dx", system="gameboy"),
+        ]
+        game_use_case = Mock()
+        game_use_case.execute.side_effect = lambda url, out, **kwargs: [_midi(out.name)]
+        use_case = DownloadSystemUseCase(khinsider_repo, game_use_case, max_workers=2)
+
+        games = use_case.execute("gameboy", tmp_path)
+
+        assert [game.midi_files[0].name for game in games] == ["zelda", "tetris"]
+        calls = game_use_case.execute.call_args_list
+        assert {call.args[1] for call in calls} == {
+            tmp_path / "gameboy" / "zelda",
+            tmp_path / "gameboy" / "tetris",
+        }
+        events = {id(call.kwargs["cancel_event"]) for call in calls}
+        assert len(events) == 1
@@ -0,0 +1,79 @@
+"""Unit tests for FileSystemRepository."""
+
+import pytest
+from midi_downloader.infrastructure.storage.file_system_repository import (
+    FileSystemRepository,
+)
+
+
+@pytest.fixture
+def repo():
+    """Provide a file system repository."""
+    return FileSystemRepository()
+
+
+class TestSaveFile:
+    """Tests for atomic whole-file writes."""
+
+    def test_save_file_writes_content_and_leaves_no_part_file(self, repo, tmp_path):
+        target = tmp_path / "nested" / "song.mid"
+
+        assert repo.save_file(b"MThd", target)
+
+        assert target.read_bytes() == b"MThd"
+        assert list(target.parent.glob("*.part")) == []
+
+    def test_save_file_keeps_empty_content(self, repo, tmp_path):
+        target = tmp_path / "empty.json"
+
+        assert repo.save_file(b"", target)
+
+        assert target.read_bytes() == b""
+
+
+class TestSaveStream:
+    """Tests for atomic streamed writes."""
+
+    def test_save_stream_returns_bytes_written(self, repo, tmp_path):
+        target = tmp_path / "song.mid"
+
+        size = repo.save_stream(iter([b"MT", b"hd"]), target)
+
+        assert size == 4
+        assert target.read_bytes() == b"MThd"
+
+    def test_save_stream_discards_empty_body(self, repo, tmp_path):
+        target = tmp_path / "song.mid"
+
+        assert repo.save_stream(iter([]), target) == 0
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_save_stream_failure_keeps_previous_file_and_removes_part(
+        self, repo, tmp_path
+    ):
+        target = tmp_path / "song.mid"
+        target.write_bytes(b"old")
+
+        def broken_stream():
+            yield b"partial"
+            raise OSError("connection reset")
+
+        assert repo.save_stream(broken_stream(), target) == 0
+
+        assert target.read_bytes() == b"old"
+        assert list(tmp_path.glob("*.part")) == []
+
+
+class TestListFiles:
+    """Tests for directory listing used by resume."""
+
+    def test_list_files_returns_only_file_names(self, repo, tmp_path):
+        (tmp_path / "a.mid").write_bytes(b"x")
+        (tmp_path / "b.mid").write_bytes(b"x")
+        (tmp_path / "subdir").mkdir()
+
+        assert repo.list_files(tmp_path) == {"a.mid", "b.mid"}
+
+    def test_list_files_missing_directory_is_empty(self, repo, tmp_path):
+        assert repo.list_files(tmp_path / "missing") == set()
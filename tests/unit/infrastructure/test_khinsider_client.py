@@ -0,0 +1,239 @@
+"""Unit tests for KhinsiderClient."""
+
+import socket
+from unittest.mock import Mock, patch
+import pytest
+from cloudscraper.exceptions import CloudflareChallengeError
+from requests import Response
+from requests.exceptions import ConnectionError
+from requests.utils import get_encoding_from_headers
+from urllib3.util import connection as urllib3_connection
+from midi_downloader.infrastructure.http import khinsider_client
+from midi_downloader.infrastructure.http.khinsider_client import (
+    NOT_MODIFIED,
+    KhinsiderClient,
+)
+
+PAGE_URL = "https://www.khinsider.com/midi/gameboy"
+
+
+def _response(status=200, content=b"", headers=None):
+    """Build a requests Response without touching the network."""
+    response = Response()
+    response.status_code = status
+    response._content = content
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    # The transport adapter normally sets this from Content-Type
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = PAGE_URL
+    return response
+
+
+def _challenge():
+    """Build a Cloudflare challenge response."""
+    return _response(503, b"challenge", {"cf-mitigated": "challenge"})
+
+
+@pytest.fixture
+def client():
+    """Provide a client with an in-memory cache and no startup network I/O."""
+    with patch.object(KhinsiderClient, "_warm_dns"), patch.object(
+        KhinsiderClient, "_solve_challenge"
+    ):
+        client = KhinsiderClient(rate_limit_delay=0, cache_name=None)
+    client.session.get = Mock()
+    client._scraper.get = Mock()
+    yield client
+    client.close()
+
+
+class TestGetText:
+    """Tests for whole-body text requests."""
+
+    def test_fresh_cached_page_skips_the_network(self, client):
+        client.session.get.return_value = _response(200, b"<html>")
+
+        assert client.get_text(PAGE_URL) == "<html>"
+        client.session.get.assert_called_once()
+        assert client.session.get.call_args.kwargs["only_if_cached"] is True
+
+    def test_cache_miss_fetches_and_defaults_to_utf8(self, client):
+        client.session.get.side_effect = [
+            _response(504),
+            _response(200, "café".encode("utf-8")),
+        ]
+
+        assert client.get_text(PAGE_URL) == "café"
+        assert client.session.get.call_count == 2
+
+    def test_declared_charset_is_respected(self, client):
+        client.session.get.return_value = _response(
+            200,
+            "café".encode("latin-1"),
+            {"Content-Type": "text/html; charset=latin-1"},
+        )
+
+        assert client.get_text(PAGE_URL) == "café"
+
+    def test_http_error_returns_none(self, client):
+        client.session.get.side_effect = [_response(504), _response(404)]
+
+        assert client.get_text(PAGE_URL) is None
+
+    def test_connection_error_returns_none(self, client):
+        client.session.get.side_effect = ConnectionError("down")
+
+        assert client.get_text(PAGE_URL) is None
+        assert client.get(PAGE_URL) is None
+
+
+class TestGetTextIfModified:
+    """Tests for conditional listing requests."""
+
+    def test_stored_validators_are_sent_and_304_is_not_modified(self, client):
+        client.session.get.return_value = _response(304)
+        validators = {"etag": '"v1"', "last_modified": "Mon, 01 Jan 2024"}
+
+        assert client.get_text_if_modified(PAGE_URL, validators) is NOT_MODIFIED
+
+        kwargs = client.session.get.call_args.kwargs
+        assert kwargs["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024",
+        }
+        assert validators["etag"] == '"v1"'
+
+    def test_full_response_refreshes_validators(self, client):
+        client.session.get.return_value = _response(
+            200, b"<html>", {"ETag": '"v2"', "Last-Modified": "Tue, 02 Jan 2024"}
+        )
+        validators = {"etag": '"v1"', "last_modified": ""}
+
+        assert client.get_text_if_modified(PAGE_URL, validators) == "<html>"
+        assert validators == {"etag": '"v2"', "last_modified": "Tue, 02 Jan 2024"}
+
+    def test_without_validators_behaves_like_get_text(self, client):
+        client.session.get.return_value = _response(200, b"<html>", {"ETag": '"v1"'})
+        validators = {"etag": "", "last_modified": ""}
+
+        assert client.get_text_if_modified(PAGE_URL, validators) == "<html>"
+        assert client.session.get.call_args.kwargs["only_if_cached"] is True
+        assert validators["etag"] == '"v1"'
+
+
+class TestStream:
+    """Tests for streamed downloads."""
+
+    def test_stream_yields_chunks_and_closes_response(self, client):
+        response = Mock(status_code=200, headers={})
+        response.iter_content.return_value = iter([b"MT", b"hd"])
+        client.session.get.return_value = response
+
+        assert list(client.stream(f"{PAGE_URL}/a.mid")) == [b"MT", b"hd"]
+        response.close.assert_called_once()
+
+    def test_stream_failure_returns_none(self, client):
+        client.session.get.return_value = _response(404)
+
+        assert client.stream(f"{PAGE_URL}/a.mid") is None
+
+
+class TestCloudflareChallenge:
+    """Tests for challenge detection, re-solving and fallback."""
+
+    def test_challenge_is_solved_once_and_request_retried(self, client):
+        client.session.get.side_effect = [_challenge(), _response(200, b"ok")]
+        client._scraper.cookies.set("cf_clearance", "token")
+
+        assert client.stream(f"{PAGE_URL}/a.mid") is not None
+
+        client._scraper.get.assert_called_once_with(client.SITE_URL, timeout=30)
+        assert client.session.cookies.get("cf_clearance") == "token"
+
+    def test_persistent_challenge_falls_back_to_cloudscraper(self, client):
+        client.session.get.side_effect = [_challenge(), _challenge()]
+        fallback = _response(200, b"ok")
+        client._scraper.get.side_effect = [_response(200), fallback]
+
+        response = client._request(PAGE_URL)
+
+        assert response is fallback
+
+    def test_unsolvable_challenge_degrades_to_none(self, client):
+        client.session.get.side_effect = [_challenge(), _challenge()]
+        client._scraper.get.side_effect = CloudflareChallengeError("captcha")
+
+        assert client.stream(f"{PAGE_URL}/a.mid") is None
+
+    def test_solve_failure_does_not_raise(self, client):
+        client._scraper.get.side_effect = CloudflareChallengeError("captcha")
+
+        client._solve_challenge()
+
+        assert client._challenge_generation == 1
+
+    def test_stale_generation_skips_repeat_solve(self, client):
+        client._challenge_generation = 2
+
+        client._solve_challenge(seen_generation=1)
+
+        client._scraper.get.assert_not_called()
+
+    def test_plain_403_is_not_a_challenge(self, client):
+        assert not client._is_challenge(_response(403, b"forbidden"))
+        assert client._is_challenge(
+            _response(403, b"/cdn-cgi/challenge-platform/", {"Server": "cloudflare"})
+        )
+
+
+class TestDnsPinning:
+    """Tests for pre-resolved connection addresses."""
+
+    @pytest.fixture(autouse=True)
+    def isolate_dns(self, monkeypatch):
+        """Restore the DNS cache and urllib3 hook after each test."""
+        monkeypatch.setattr(khinsider_client, "_DNS_CACHE", {})
+        monkeypatch.setattr(
+            urllib3_connection,
+            "create_connection",
+            urllib3_connection.create_connection,
+        )
+
+    def test_warm_dns_pins_unique_addresses(self, client):
+        addr_info = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("1.2.3.4", 443)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("1.2.3.4", 443)),
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("::1", 443, 0, 0)),
+        ]
+        with patch("socket.getaddrinfo", return_value=addr_info):
+            client._warm_dns()
+
+        assert khinsider_client._DNS_CACHE[(client.HOST, 443)] == ["1.2.3.4", "::1"]
+        assert urllib3_connection.create_connection is (
+            khinsider_client._cached_create_connection
+        )
+
+    def test_resolution_failure_leaves_resolver_alone(self, client):
+        original = urllib3_connection.create_connection
+        with patch("socket.getaddrinfo", side_effect=socket.gaierror):
+            client._warm_dns()
+
+        assert urllib3_connection.create_connection is original
+
+    def test_connection_tries_pinned_addresses_then_hostname(self, monkeypatch):
+        khinsider_client._DNS_CACHE[("host", 443)] = ["10.0.0.1", "10.0.0.2"]
+        sock = Mock()
+        connect = Mock(side_effect=[OSError, sock])
+        monkeypatch.setattr(khinsider_client, "_original_create_connection", connect)
+
+        assert khinsider_client._cached_create_connection(("host", 443)) is sock
+        assert [call.args[0] for call in connect.call_args_list] == [
+            ("10.0.0.1", 443),
+            ("10.0.0.2", 443),
+        ]
+
+        connect.reset_mock(side_effect=True)
+        connect.side_effect = [OSError, OSError, sock]
+        assert khinsider_client._cached_create_connection(("host", 443)) is sock
+        assert connect.call_args.args[0] == ("host", 443)
@@ -0,0 +1,171 @@
+"""Unit tests for KhinsiderRepositoryImpl."""
+
+import json
+from unittest.mock import Mock
+import pytest
+from midi_downloader.infrastructure.http.khinsider_client import NOT_MODIFIED
+from midi_downloader.infrastructure.scraping.khinsider_scraper import KhinsiderScraper
+from midi_downloader.infrastructure.storage.khinsider_repository_impl import (
+    KhinsiderRepositoryImpl,
+)
+
+SYSTEM_URL = "https://www.khinsider.com/midi/gameboy"
+GAME_URL = "https://www.khinsider.com/midi/gameboy/zelda"
+LISTING = (
+    "<table>"
+    "<tr><th>Name</th><th>Files</th></tr>"
+    '<tr><td><a href="/midi/gameboy/zelda">Zelda</a></td><td>1</td></tr>'
+    "</table>"
+)
+
+
+@pytest.fixture
+def client():
+    """Provide a mocked HTTP client."""
+    return Mock()
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """Provide a listing cache location."""
+    return tmp_path / ".khinsider_listings.json"
+
+
+def _refresh_validators(etag):
+    """Build a get_text_if_modified side effect serving a fresh listing."""
+
+    def get_text_if_modified(url, validators):
+        validators["etag"] = etag
+        validators["last_modified"] = ""
+        return LISTING
+
+    return get_text_if_modified
+
+
+def _write_cache(cache_path, system):
+    """Store one cached listing for SYSTEM_URL."""
+    listings = {
+        SYSTEM_URL: {
+            "system": system,
+            "etag": '"v1"',
+            "last_modified": "",
+            "games": [{"name": "Cached", "url": f"{SYSTEM_URL}/cached"}],
+        }
+    }
+    cache_path.write_text(json.dumps(listings), encoding="utf-8")
+
+
+class TestGetGamesForSystem:
+    """Tests for system listing retrieval and its conditional cache."""
+
+    def test_without_cache_fetches_and_parses(self, client):
+        client.get_text.return_value = LISTING
+        repo = KhinsiderRepositoryImpl(client, KhinsiderScraper())
+
+        games = repo.get_games_for_system("gameboy")
+
+        client.get_text.assert_called_once_with(SYSTEM_URL)
+        assert [(game.name, game.url) for game in games] == [("Zelda", GAME_URL)]
+
+    def test_full_response_is_cached_with_validators(self, client, cache_path):
+        client.get_text_if_modified.side_effect = _refresh_validators('"v1"')
+        repo = KhinsiderRepositoryImpl(client, KhinsiderScraper(), cache_path)
+
+        games = repo.get_games_for_system("gameboy")
+
+        assert [game.name for game in games] == ["Zelda"]
+        entry = json.loads(cache_path.read_text(encoding="utf-8"))[SYSTEM_URL]
+        assert entry["system"] == "gameboy"
+        assert entry["etag"] == '"v1"'
+        assert entry["games"] == [{"name": "Zelda", "url": GAME_URL}]
+
+    def test_not_modified_loads_cached_games_without_parsing(self, client, cache_path):
+        _write_cache(cache_path, "gameboy")
+        client.get_text_if_modified.return_value = NOT_MODIFIED
+        scraper = Mock(wraps=KhinsiderScraper(), BASE_URL=KhinsiderScraper.BASE_URL)
+        repo = KhinsiderRepositoryImpl(client, scraper, cache_path)
+
+        games = repo.get_games_for_system("gameboy")
+
+        sent = client.get_text_if_modified.call_args.args[1]
+        assert sent["etag"] == '"v1"'
+        scraper.parse_game_list.assert_not_called()
+        assert [(game.name, game.system) for game in games] == [("Cached", "gameboy")]
+
+    def test_system_name_mismatch_ignores_cached_entry(self, client, cache_path):
+        _write_cache(cache_path, "GameBoy")
+        client.get_text_if_modified.side_effect = _refresh_validators('"v2"')
+        repo = KhinsiderRepositoryImpl(client, KhinsiderScraper(), cache_path)
+
+        games = repo.get_games_for_system("gameboy")
+
+        assert [game.name for game in games] == ["Zelda"]
+        entry = json.loads(cache_path.read_text(encoding="utf-8"))[SYSTEM_URL]
+        assert entry["system"] == "gameboy"
+
+    def test_system_name_mismatch_sends_no_validators(self, client, cache_path):
+        _write_cache(cache_path, "GameBoy")
+        seen = {}
+
+        def get_text_if_modified(url, validators):
+            seen.update(validators)
+            return LISTING
+
+        client.get_text_if_modified.side_effect = get_text_if_modified
+        repo = KhinsiderRepositoryImpl(client, KhinsiderScraper(), cache_path)
+
+        repo.get_games_for_system("gameboy")
+
+        assert seen == {"etag": "", "last_modified": ""}
+
+    def test_not_modified_without_entry_returns_empty(self, client, cache_path):
+        client.get_text_if_modified.return_value = NOT_MODIFIED
+        repo = KhinsiderRepositoryImpl(client, KhinsiderScraper(), cache_path)
+
+        assert repo.get_games_for_system("gameboy") == []
+
+    def test_corrupt_cache_is_ignored(self, client, cache_path):
+        cache_path.write_text("{not json", encoding="utf-8")
+        client.get_text_if_modified.side_effect = _refresh_validators("")
+        repo = KhinsiderRepositoryImpl(client, KhinsiderScraper(), cache_path)
+
+        games = repo.get_games_for_system("gameboy")
+
+        assert [game.name for game in games] == ["Zelda"]
+        assert cache_path.read_text(encoding="utf-8") == "{not json"
+
+
+class TestGetMidiFilesForGame:
+    """Tests for game page retrieval and detail page resolution."""
+
+    def test_detail_pages_are_fetched_only_for_khinsider_pages(self, client):
+        game_page = (
+            "<table>"
+            '<tr><td><a href="zelda/song.mid">Direct</a></td><td>1</td></tr>'
+            '<tr><td><a href="https://cdn.example/b.mid">CDN</a></td><td>1</td></tr>'
+            '<tr><td><a href="zelda/c.midi-page">Detail</a></td><td>1</td></tr>'
+            "</table>"
+        )
+        detail_page = '<a href="https://dl.example/c.mid">Click here to download</a>'
+        client.get_text.side_effect = lambda url: (
+            game_page if url == GAME_URL else detail_page
+        )
+        repo = KhinsiderRepositoryImpl(client, KhinsiderScraper())
+
+        midis = repo.get_midi_files_for_game(GAME_URL)
+
+        fetched = [call.args[0] for call in client.get_text.call_args_list]
+        assert fetched == [GAME_URL, f"{GAME_URL}/c.midi-page"]
+        assert [midi.url for midi in midis] == [
+            f"{GAME_URL}/song.mid",
+            "https://cdn.example/b.mid",
+            "https://dl.example/c.mid",
+        ]
+        assert midis[2].filename == "c.mid"
+        assert all(midi.system == "gameboy" for midi in midis)
+
+    def test_failed_game_page_returns_empty(self, client):
+        client.get_text.return_value = None
+        repo = KhinsiderRepositoryImpl(client, KhinsiderScraper())
+
+        assert repo.get_midi_files_for_game(GAME_URL) == []
@@ -0,0 +1,133 @@
+"""Unit tests for KhinsiderScraper."""
+
+import pytest
+from midi_downloader.infrastructure.scraping.khinsider_scraper import KhinsiderScraper
+
+SYSTEM_URL = "https://www.khinsider.com/midi/gameboy"
+GAME_URL = "https://www.khinsider.com/midi/gameboy/the.midnight"
+DETAIL_URL = "https://www.khinsider.com/midi/gameboy/the.midnight/song"
+
+
+@pytest.fixture
+def scraper():
+    """Provide a scraper instance."""
+    return KhinsiderScraper()
+
+
+def _table(*cells):
+    """Build a listing table with a header and one row per first-cell HTML."""
+    rows = "".join(f"<tr><td>{cell}</td><td>info</td></tr>" for cell in cells)
+    header = "<tr><th>Name</th><th>Info</th></tr>"
+    return f"<html><body><table>{header}{rows}</table></body></html>"
+
+
+class TestParseGameList:
+    """Tests for system listing parsing."""
+
+    def test_relative_hrefs_resolve_against_page(self, scraper):
+        page = _table('<a href="gameboy/zelda">Zelda</a>', '<a href="/midi/x">X</a>')
+
+        games = list(scraper.parse_game_list(page, "gameboy", SYSTEM_URL))
+
+        assert [(game.name, game.url, game.system) for game in games] == [
+            ("Zelda", "https://www.khinsider.com/midi/gameboy/zelda", "gameboy"),
+            ("X", "https://www.khinsider.com/midi/x", "gameboy"),
+        ]
+
+    def test_rows_without_href_are_skipped(self, scraper):
+        page = _table('<a href="">Empty</a>', "<a>None</a>", '<a href="z">Z</a>')
+
+        games = list(scraper.parse_game_list(page, "gameboy", SYSTEM_URL))
+
+        assert [game.name for game in games] == ["Z"]
+
+    def test_unparsable_page_yields_nothing(self, scraper):
+        assert list(scraper.parse_game_list("", "gameboy")) == []
+
+
+class TestParseMidiList:
+    """Tests for game page parsing."""
+
+    def test_relative_midi_links_resolve_against_page(self, scraper):
+        page = _table('<a href="the.midnight/song.mid">Song</a>')
+
+        midis = list(scraper.parse_midi_list(page, "the.midnight", "gameboy", GAME_URL))
+
+        assert len(midis) == 1
+        assert (
+            midis[0].url
+            == "https://www.khinsider.com/midi/gameboy/the.midnight/song.mid"
+        )
+        assert midis[0].filename == "song.mid"
+
+    def test_empty_and_same_page_hrefs_on_mid_slug_are_skipped(self, scraper):
+        page = _table(
+            '<a href="">Empty</a>',
+            '<a href="#top">Top</a>',
+            "<a>Missing</a>",
+            '<a href="the.midnight/song.mid">Song</a>',
+        )
+
+        midis = list(scraper.parse_midi_list(page, "the.midnight", "gameboy", GAME_URL))
+
+        assert [midi.name for midi in midis] == ["Song"]
+
+    def test_non_midi_links_are_skipped(self, scraper):
+        page = _table('<a href="/forums">Forums</a>')
+
+        midis = list(scraper.parse_midi_list(page, "game", "gameboy", SYSTEM_URL))
+
+        assert midis == []
+
+
+class TestParseMidiDownloadUrl:
+    """Tests for detail page download link extraction."""
+
+    def test_fast_path_returns_absolute_href(self, scraper):
+        page = '<p><a href="https://dl.example/a.mid">Click here to download</a></p>'
+
+        assert scraper.parse_midi_download_url(page, DETAIL_URL) == (
+            "https://dl.example/a.mid"
+        )
+
+    def test_fast_path_resolves_relative_and_escaped_href(self, scraper):
+        page = '<a class="btn" href="/get?f=a.mid&amp;t=1">Click here to download</a>'
+
+        assert scraper.parse_midi_download_url(page, DETAIL_URL) == (
+            "https://www.khinsider.com/get?f=a.mid&t=1"
+        )
+
+    def test_fast_path_ignores_data_href(self, scraper):
+        page = (
+            '<a href="https://ok/a.mid" data-href="https://evil/x.css">'
+            "Click here to download</a>"
+        )
+
+        assert scraper._find_download_href(page, DETAIL_URL) == "https://ok/a.mid"
+
+    def test_fast_path_ignores_href_only_in_look_alike_attribute(self, scraper):
+        page = '<a data-href="https://evil/x.css">Click here to download</a>'
+
+        assert scraper._find_download_href(page, DETAIL_URL) is None
+
+    def test_fast_path_rejects_text_outside_the_anchor(self, scraper):
+        page = '<a href="https://evil/x.css">Home</a><p>Click here to download</p>'
+
+        assert scraper._find_download_href(page, DETAIL_URL) is None
+        assert scraper.parse_midi_download_url(page, DETAIL_URL) is None
+
+    def test_fast_path_rejects_href_of_non_anchor_tag(self, scraper):
+        page = '<link href="https://evil/x.css"><span>Click here to download</span>'
+
+        assert scraper._find_download_href(page, DETAIL_URL) is None
+
+    def test_fallback_parses_single_quoted_href(self, scraper):
+        page = "<a href='/a.mid'>Click here to download</a>"
+
+        assert scraper._find_download_href(page, DETAIL_URL) is None
+        assert scraper.parse_midi_download_url(page, DETAIL_URL) == (
+            "https://www.khinsider.com/a.mid"
+        )
+
+    def test_missing_link_returns_none(self, scraper):
+        assert scraper.parse_midi_download_url("<p>Nothing here</p>") is None
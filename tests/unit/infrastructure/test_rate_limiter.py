@@ -0,0 +1,39 @@
+"""Unit tests for TokenBucket."""
+
+from unittest.mock import patch
+from midi_downloader.infrastructure.http.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for the shared request rate limiter."""
+
+    def test_zero_rate_never_waits(self):
+        bucket = TokenBucket(rate=0)
+
+        with patch("time.sleep") as sleep:
+            for _ in range(5):
+                bucket.acquire()
+
+        sleep.assert_not_called()
+
+    def test_burst_is_served_without_waiting(self):
+        bucket = TokenBucket(rate=1.0, capacity=3)
+
+        with patch("time.sleep") as sleep:
+            for _ in range(3):
+                bucket.acquire()
+
+        sleep.assert_not_called()
+
+    def test_request_beyond_burst_waits_for_a_token(self):
+        bucket = TokenBucket(rate=2.0, capacity=1)
+
+        with patch("time.sleep") as sleep:
+            bucket.acquire()
+            bucket.acquire()
+
+        sleep.assert_called_once()
+        assert 0.4 < sleep.call_args.args[0] <= 0.5
+
+    def test_capacity_is_at_least_one(self):
+        assert TokenBucket(rate=1.0, capacity=0).capacity == 1